@@ -1,5 +1,7 @@
 # config.py
+import atexit
 import logging
+import logging.handlers
 import os
 from typing import Optional
 from pathlib import Path
@@ -20,21 +22,36 @@ class ColorFormatter(logging.Formatter):
         logging.CRITICAL: red
     }
     
+    def __init__(self, fmt: str = '%(levelname)s: %(message)s', datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        # Bake the color codes into one formatter per level up front
+        self._formatters = {
+            level: self._colored(fmt, color, datefmt) for level, color in self.FORMATS.items()
+        }
+        self._highlight_formatter = self._colored(fmt, self.bold_white, datefmt)
+
+    @classmethod
+    def _colored(cls, fmt: str, color: str, datefmt: Optional[str]) -> logging.Formatter:
+        return logging.Formatter(fmt.replace('%(levelname)s', f"{color}%(levelname)s{cls.reset}"), datefmt)
+
     def format(self, record):
-        # Add color to level names
-        color = self.FORMATS.get(record.levelno)
-        if record.levelno == logging.INFO and getattr(record, 'highlight', False):
-            color = self.bold_white
-            
-        record.levelname = f"{color}{record.levelname}{self.reset}"
-        
-        # Add visual separators for different message types
+        # Add visual separators for different message types, on a copy so
+        # other handlers still see the original message
         if getattr(record, 'separator', False):
+            record = logging.makeLogRecord(record.__dict__)
             record.msg = f"\n{'='*80}\n{record.msg}\n{'='*80}"
         elif getattr(record, 'subseparator', False):
+            record = logging.makeLogRecord(record.__dict__)
             record.msg = f"\n{'-'*50}\n{record.msg}"
-            
-        return super().format(record)
+
+        if record.levelno == logging.INFO and getattr(record, 'highlight', False):
+            formatter = self._highlight_formatter
+        else:
+            formatter = self._formatters.get(record.levelno)
+        if formatter is None:
+            # Custom levels have no color; format them plainly
+            return super().format(record)
+        return formatter.format(record)
 
 def setup_logging():
     """Configure logging for the application."""
@@ -53,4 +70,11 @@ def setup_logging():
         debug_handler.setFormatter(logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         ))
-        logging.getLogger().addHandler(debug_handler)
\ No newline at end of file
+        # Buffer debug records and write them out in batches rather than per record
+        buffered_handler = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=debug_handler
+        )
+        logging.getLogger().addHandler(buffered_handler)
+        atexit.register(buffered_handler.close)
\ No newline at end of file
@@ -1,33 +1,71 @@
 import os
 from pathlib import Path
 import logging
+from typing import Iterator, Optional
 
 logger = logging.getLogger(__name__)
 
-VALID_EXTENSIONS = {'.mp4', '.mkv', '.avi', '.mov', '.wmv'}
+VALID_EXTENSIONS = frozenset({'.mp4', '.mkv', '.avi', '.mov', '.wmv'})
+# str.endswith() accepts a tuple and checks every suffix in C
+_VIDEO_SUFFIXES = tuple(VALID_EXTENSIONS)
 
-def get_video_files(directory: Path, recursive: bool = False) -> list[Path]:
-    """Get all video files in the specified directory."""
+def _maybe_video(entry: os.DirEntry) -> Optional[Path]:
+    """Return the entry's path if it names a video file, else None."""
+    name = entry.name
+    if '.processing.' in name:  # Skip processing files
+        return None
+    if not name.lower().endswith(_VIDEO_SUFFIXES):
+        return None
+    if not entry.is_file():
+        return None
+    # The scan root is already resolved, so only symlinked entries need resolving
+    return Path(entry.path).resolve() if entry.is_symlink() else Path(entry.path)
+
+def _scan(directory: str, recursive: bool) -> Iterator[Path]:
+    """Yield video files under directory, descending into subdirectories if recursive."""
+    # os.fwalk() is built on the same scandir() calls but also opens and fstat()s
+    # each directory and hands back bare names, so the file type would have to
+    # be re-queried per candidate. Walking scandir() directly keeps DirEntry's
+    # cached type and costs one getdents pass per directory.
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    # A symlink loop or an unreadable entry is reported on its own
+                    # so it does not cost the rest of the directory
+                    try:
+                        if recursive and entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        video = _maybe_video(entry)
+                    except OSError as e:
+                        logger.warning(f"Error processing path {entry.path}: {str(e)}")
+                        continue
+                    if video is not None:
+                        yield video
+        except OSError as e:
+            logger.warning(f"Error scanning directory {current}: {str(e)}")
+
+def iter_video_files(directory: Path, recursive: bool = False) -> Iterator[Path]:
+    """Lazily yield video files in the specified directory as the walk finds them."""
     directory = Path(directory).resolve()
+    # Validate eagerly so bad input fails at the call site, not on first iteration
     if not directory.is_dir():
         raise ValueError(f"'{directory}' is not a valid directory")
     if not os.access(directory, os.R_OK):
         raise ValueError(f"'{directory}' is not readable")
 
-    pattern = '**/*' if recursive else '*'
+    return _scan(str(directory), recursive)
+
+def get_video_files(directory: Path, recursive: bool = False) -> list[Path]:
+    """Get all video files in the specified directory."""
     video_files = []
-    
-    for file_path in directory.glob(pattern):
-        try:
-            if (file_path.suffix.lower() in VALID_EXTENSIONS and 
-                '.processing.' not in file_path.name):  # Skip processing files
-                resolved_path = file_path.resolve()
-                if resolved_path.exists() and os.access(resolved_path, os.R_OK):
-                    video_files.append(resolved_path)
-                    logger.info(f"Found video file: {resolved_path}")
-                else:
-                    logger.warning(f"File exists but is not accessible: {resolved_path}")
-        except Exception as e:
-            logger.warning(f"Error processing path {file_path}: {str(e)}")
-            
-    return video_files
\ No newline at end of file
+
+    for video in iter_video_files(directory, recursive):
+        # Unreadable files are reported by ffprobe when they are analyzed
+        video_files.append(video)
+        logger.debug("Found video file: %s", video)
+
+    return video_files
@@ -1,23 +1,29 @@
 import argparse
 import logging
+import sys
 from pathlib import Path
 from .file_handler import get_video_files
 from .space_analyzer import format_size
 from .video_processor import VideoProcessor
 from .config import setup_logging
+from .probe_cache import open_cache
+
+def parse_language_list(lang_string: str) -> frozenset[str]:
+    """Parse comma-separated language string into a set for fast membership tests."""
+    return frozenset(x.strip().lower() for x in lang_string.split(',') if x.strip())
 
 def parse_args():
     parser = argparse.ArgumentParser(description='Manage audio and subtitle tracks in video files.')
     parser.add_argument('input_dir', type=str, help='Directory containing video files')
     audio_group = parser.add_mutually_exclusive_group()
-    audio_group.add_argument('--remove-audio-languages', type=str, 
+    audio_group.add_argument('--remove-audio-languages', type=parse_language_list, default=frozenset(), 
                             help='Comma-separated list of language codes to remove from audio (e.g., "eng,jpn")')
-    audio_group.add_argument('--keep-audio-languages', type=str, 
+    audio_group.add_argument('--keep-audio-languages', type=parse_language_list, default=frozenset(), 
                             help='Comma-separated list of audio language codes to keep, remove others')
     subtitle_group = parser.add_mutually_exclusive_group()
-    subtitle_group.add_argument('--remove-subtitle-languages', type=str, 
+    subtitle_group.add_argument('--remove-subtitle-languages', type=parse_language_list, default=frozenset(), 
                               help='Comma-separated list of language codes to remove from subtitles')
-    subtitle_group.add_argument('--keep-subtitle-languages', type=str, 
+    subtitle_group.add_argument('--keep-subtitle-languages', type=parse_language_list, default=frozenset(), 
                               help='Comma-separated list of subtitle language codes to keep, remove others')
     parser.add_argument('--audio', action='store_true', help='Process audio tracks')
     parser.add_argument('--subtitles', action='store_true', help='Process subtitle tracks')
@@ -30,26 +36,33 @@ def parse_args():
     parser.add_argument('--batch-size', type=int, default=3,
                        help='Number of videos to process simultaneously (default: 3)')
     parser.add_argument('--max-workers', type=int,
-                       help='Maximum number of worker processes (default: number of CPUs - 1)')
+                       help='Maximum number of concurrent probes (default: twice the number of CPUs)')
+    parser.add_argument('--ffmpeg-threads', type=int,
+                       help='Threads per ffmpeg process (default: number of CPUs / batch size)')
+    parser.add_argument('--scratch-dir', type=str,
+                       help='Directory for temporary output, e.g. on faster local storage '
+                            '(default: alongside each video)')
     parser.add_argument('--limit', type=int,
                        help='Maximum number of video files to process (default: no limit)')
+    parser.add_argument('--clear-probe-cache', action='store_true',
+                       help='Forget cached ffprobe results before scanning (kept in '
+                            'media_trimmer/probe.sqlite under $XDG_CACHE_HOME or ~/.cache)')
     return parser.parse_args()
 
-def parse_language_list(lang_string: str) -> list[str]:
-    """Parse comma-separated language string into list."""
-    return [x.strip().lower() for x in lang_string.split(',')] if lang_string else []
-
 def main():
     args = parse_args()
     setup_logging()
+    cache = open_cache()
+    if cache is not None and args.clear_probe_cache:
+        cache.clear()
     logger = logging.getLogger(__name__)
     
     try:
         input_path = Path(args.input_dir).resolve()
-        remove_audio_languages = parse_language_list(args.remove_audio_languages)
-        keep_audio_languages = parse_language_list(args.keep_audio_languages)
-        remove_subtitle_languages = parse_language_list(args.remove_subtitle_languages)
-        keep_subtitle_languages = parse_language_list(args.keep_subtitle_languages)
+        remove_audio_languages = args.remove_audio_languages
+        keep_audio_languages = args.keep_audio_languages
+        remove_subtitle_languages = args.remove_subtitle_languages
+        keep_subtitle_languages = args.keep_subtitle_languages
         
         process_audio = args.audio or bool(remove_audio_languages or keep_audio_languages)
         process_subtitles = args.subtitles or bool(remove_subtitle_languages or keep_subtitle_languages)
@@ -72,7 +85,10 @@ def main():
             backup=args.backup,
             max_workers=args.max_workers,
             batch_size=args.batch_size,
-            file_limit=args.limit
+            file_limit=args.limit,
+            ffmpeg_threads=args.ffmpeg_threads,
+            scratch_dir=args.scratch_dir,
+            show_progress=sys.stderr.isatty()
         )
 
         if args.list_tracks:
@@ -97,6 +113,7 @@ def main():
         if args.limit:
             logger.info(f"Files scanned:         {results['files_scanned']}")
         logger.info(f"Files needing changes:  {results['files_needing_changes']}")
+        logger.info(f"Already up to date:     {results['skipped']}")
         logger.info(f"Successfully processed: {results['successful']}")
         
         if results['failed'] > 0:
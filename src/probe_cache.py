@@ -0,0 +1,82 @@
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS probes (
+    path TEXT NOT NULL,
+    query TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    returncode INTEGER NOT NULL,
+    output BLOB NOT NULL,
+    PRIMARY KEY (path, query)
+)
+"""
+
+class ProbeCache:
+    """On-disk store of ffprobe results that survives between runs.
+
+    Entries are keyed by path and the ffprobe query, and are only returned
+    while the file's mtime and size still match. Failed probes are stored
+    too, so broken files are not probed again on every run.
+    """
+
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        # The analysis pool threads all probe through this one connection, so guard it with a lock
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+
+    def get(self, path: str, query: str, mtime_ns: int, size: int) -> Optional[Tuple[int, bytes]]:
+        """Return (returncode, output) for a matching entry, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT returncode, output FROM probes "
+                "WHERE path = ? AND query = ? AND mtime_ns = ? AND size = ?",
+                (path, query, mtime_ns, size)
+            ).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def put(self, path: str, query: str, mtime_ns: int, size: int, returncode: int, output: bytes):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO probes VALUES (?, ?, ?, ?, ?, ?)",
+                (path, query, mtime_ns, size, returncode, output)
+            )
+
+    def clear(self):
+        """Forget every stored probe result."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM probes")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+_cache: Optional[ProbeCache] = None
+
+def default_cache_path() -> Path:
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'media_trimmer' / 'probe.sqlite'
+
+def open_cache(db_path: Optional[Path] = None) -> Optional[ProbeCache]:
+    """Enable the process-wide probe cache; failures leave it disabled."""
+    global _cache
+    try:
+        _cache = ProbeCache(db_path or default_cache_path())
+    except (OSError, sqlite3.Error) as e:
+        logger.debug(f"Probe cache disabled: {str(e)}")
+        _cache = None
+    return _cache
+
+def get_cache() -> Optional[ProbeCache]:
+    return _cache
@@ -1,11 +1,136 @@
 from pathlib import Path
-from typing import Dict, List, NamedTuple
+from typing import Dict, List, NamedTuple, Optional
+from functools import lru_cache
 import json
+import os
+import sqlite3
+from stat import S_ISREG
 import subprocess
 import logging
+from .probe_cache import get_cache
+from .track_manager import LanguageFilter
+
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+try:
+    import av
+except ImportError:
+    av = None
 
 logger = logging.getLogger(__name__)
 
+# Every field the stream-size and track-listing code reads, so one probe serves both
+_PROBE_ENTRIES = (
+    'stream=index,codec_type,bit_rate'
+    ':stream_tags=language,title,BPS,bit_rate'
+    ':stream_disposition=default,forced'
+    ':format=duration'
+)
+
+# libavformat AV_DISPOSITION_* flags
+_DISPOSITION_DEFAULT = 0x0001
+_DISPOSITION_FORCED = 0x0040
+
+def _probe_with_av(path_str: str) -> Optional[dict]:
+    """Read the probe fields in-process with PyAV, shaped like ffprobe's JSON.
+
+    Returns None if the file cannot be opened, so the caller can fall back to
+    ffprobe and report its error message.
+    """
+    try:
+        with av.open(path_str) as container:
+            streams = []
+            for stream in container.streams:
+                entry = {'index': stream.index, 'codec_type': stream.type}
+                if stream.bit_rate:
+                    entry['bit_rate'] = str(stream.bit_rate)
+                if stream.metadata:
+                    entry['tags'] = dict(stream.metadata)
+                disposition = int(getattr(stream, 'disposition', 0) or 0)
+                entry['disposition'] = {
+                    'default': int(bool(disposition & _DISPOSITION_DEFAULT)),
+                    'forced': int(bool(disposition & _DISPOSITION_FORCED))
+                }
+                streams.append(entry)
+            data = {'streams': streams, 'format': {}}
+            if container.duration is not None:
+                data['format']['duration'] = str(container.duration / av.time_base)
+            return data
+    except Exception as e:
+        logger.debug(f"PyAV could not open {path_str}: {str(e)}")
+        return None
+
+@lru_cache(maxsize=1024)
+def _probe(path_str: str, mtime_ns: int, size: int) -> dict:
+    """Run ffprobe on a file and return the parsed JSON output.
+
+    Keyed on mtime and size as well as the path so that a modified file
+    is probed again rather than served from the cache. When the on-disk
+    probe cache is open it is consulted before spawning ffprobe. If PyAV
+    is installed the file is read in-process instead of spawning ffprobe.
+    """
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-print_format', 'json',
+        # Only ask for the fields we read, to keep the output small
+        '-show_entries', _PROBE_ENTRIES,
+        path_str
+    ]
+    cache = get_cache()
+    cached = None
+    if cache is not None:
+        try:
+            cached = cache.get(path_str, _PROBE_ENTRIES, mtime_ns, size)
+        except sqlite3.Error as e:
+            logger.debug(f"Probe cache lookup failed: {str(e)}")
+
+    if cached is not None:
+        returncode, output = cached
+    elif av is not None and (data := _probe_with_av(path_str)) is not None:
+        if cache is not None:
+            try:
+                cache.put(path_str, _PROBE_ENTRIES, mtime_ns, size, 0, _dumps(data))
+            except sqlite3.Error as e:
+                logger.debug(f"Probe cache update failed: {str(e)}")
+        return data
+    else:
+        # stdout stays bytes: both orjson and json.loads accept it without a decode step.
+        # With -v error stderr is normally empty and only read on failure.
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        returncode = result.returncode
+        output = result.stdout if returncode == 0 else result.stderr
+        # A negative code means ffprobe was killed by a signal (e.g. Ctrl-C),
+        # which says nothing about the file, so only real verdicts are kept
+        if cache is not None and returncode >= 0:
+            try:
+                cache.put(path_str, _PROBE_ENTRIES, mtime_ns, size, returncode, output)
+            except sqlite3.Error as e:
+                logger.debug(f"Probe cache update failed: {str(e)}")
+
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=output)
+    return _loads(output)
+
+def probe_video(video_path: Path, _stat: os.stat_result = None) -> dict:
+    """Return the (cached) ffprobe JSON for a video.
+
+    The result is shared between callers and must not be modified.
+    Raises subprocess.CalledProcessError if ffprobe fails.
+    """
+    st = _stat or os.stat(video_path)
+    return _probe(str(video_path), st.st_mtime_ns, st.st_size)
+
 class StreamSize(NamedTuple):
     type: str
     language: str
@@ -13,28 +138,10 @@ class StreamSize(NamedTuple):
 
 class SpaceAnalyzer:
     @staticmethod
-    def get_stream_sizes(video_path: Path) -> List[StreamSize]:
+    def get_stream_sizes(video_path: Path, _stat: os.stat_result = None) -> List[StreamSize]:
         """Analyze video file to get the size of each stream."""
-        video_path = Path(video_path).resolve()
-        
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-print_format', 'json',
-            '-show_streams',
-            '-show_format',
-            str(video_path)
-        ]
-        
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            data = json.loads(result.stdout)
+            data = probe_video(video_path, _stat)
             
             if not data.get('format'):
                 raise RuntimeError("No format information found in the video file")
@@ -44,60 +151,71 @@ class SpaceAnalyzer:
                 raise RuntimeError("Could not determine video duration")
                 
             stream_sizes = []
-            for stream in data.get('streams', []):
-                if stream['codec_type'] not in ('audio', 'subtitle'):
+            for stream in data.get('streams', ()):
+                codec_type = stream.get('codec_type')
+                if codec_type not in ('audio', 'subtitle'):
                     continue
                     
                 # Try multiple ways to get bitrate information
-                bit_rate = None
-                if 'bit_rate' in stream:
-                    bit_rate = stream['bit_rate']
-                elif 'tags' in stream:
-                    tags = stream['tags']
-                    bit_rate = tags.get('BPS') or tags.get('bit_rate')
+                tags = stream.get('tags') or {}
+                bit_rate = stream.get('bit_rate') or tags.get('BPS') or tags.get('bit_rate')
+                if not bit_rate:
+                    continue
                     
-                if bit_rate:
-                    try:
-                        size_bytes = int(float(bit_rate) * duration / 8)
-                        stream_sizes.append(StreamSize(
-                            type=stream['codec_type'],
-                            language=stream.get('tags', {}).get('language', 'und'),
-                            size_bytes=size_bytes
-                        ))
-                    except (ValueError, TypeError):
-                        logger.warning(f"Could not calculate size for {stream['codec_type']} stream")
+                try:
+                    stream_sizes.append(StreamSize(
+                        type=codec_type,
+                        language=tags.get('language', 'und'),
+                        size_bytes=int(float(bit_rate) * duration / 8)
+                    ))
+                except (ValueError, TypeError):
+                    logger.warning(f"Could not calculate size for {codec_type} stream")
                         
             return stream_sizes
             
         except subprocess.CalledProcessError as e:
-            error_output = e.stderr.strip() if e.stderr else "No error output available"
+            error_output = e.stderr.decode(errors='replace').strip() if e.stderr else "No error output available"
             raise RuntimeError(f"Failed to analyze video streams: {error_output}")
         except json.JSONDecodeError:
             raise RuntimeError("Failed to parse ffprobe output")
         except Exception as e:
             raise RuntimeError(f"Unexpected error analyzing streams: {str(e)}")
 
-    def analyze_savings(self, video_path: Path, **kwargs) -> dict:
-        """Analyze potential space savings from removing tracks."""
-        video_path = Path(video_path).resolve()
-        if not video_path.exists():
+    def analyze_savings(self, video_path: Path, filters: Dict[str, LanguageFilter],
+                        _stat: os.stat_result = None) -> dict:
+        """Analyze potential space savings from removing tracks.
+
+        filters maps each track type to its (remove_languages, keep_languages).
+        """
+        # Paths from get_video_files() are already resolved
+        try:
+            st = _stat or os.stat(video_path)
+        except FileNotFoundError:
+            st = None
+        if st is None or not S_ISREG(st.st_mode):
             raise RuntimeError(f"File not found: {video_path}")
             
-        stream_sizes = self.get_stream_sizes(video_path)
         total_savings = 0
         savings_breakdown = {
             'audio': {'bytes': 0, 'tracks': 0},
             'subtitle': {'bytes': 0, 'tracks': 0}
         }
+
+        # Nothing can be removed, so skip probing the file altogether
+        if not filters:
+            return {
+                'total_savings': total_savings,
+                'breakdown': savings_breakdown,
+                'original_size': st.st_size
+            }
+            
+        stream_sizes = self.get_stream_sizes(video_path, _stat=st)
         
         for stream in stream_sizes:
-            if not kwargs.get('process_audio') and stream.type == 'audio':
+            stream_filter = filters.get(stream.type)
+            if stream_filter is None:
                 continue
-            if not kwargs.get('process_subtitles') and stream.type == 'subtitle':
-                continue
-            
-            remove_langs = kwargs.get('remove_audio_languages') if stream.type == 'audio' else kwargs.get('remove_subtitle_languages')
-            keep_langs = kwargs.get('keep_audio_languages') if stream.type == 'audio' else kwargs.get('keep_subtitle_languages')
+            remove_langs, keep_langs = stream_filter
             
             should_remove = False
             if remove_langs and stream.language in remove_langs:
@@ -113,13 +231,15 @@ class SpaceAnalyzer:
         return {
             'total_savings': total_savings,
             'breakdown': savings_breakdown,
-            'original_size': Path(video_path).stat().st_size
+            'original_size': st.st_size
         }
 
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 def format_size(size_bytes: int) -> str:
     """Format byte size to human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.2f} TB"
\ No newline at end of file
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit
+    idx = min((int(size_bytes).bit_length() - 1) // 10, len(_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.2f} {_UNITS[idx]}"
\ No newline at end of file
@@ -1,5 +1,8 @@
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import AbstractSet, Dict, List, Optional, Tuple
+
+# (remove_languages, keep_languages) for one track type
+LanguageFilter = Tuple[Optional[AbstractSet[str]], Optional[AbstractSet[str]]]
 
 @dataclass
 class TrackInfo:
@@ -14,16 +17,20 @@ class TrackManager:
     def __init__(self, tracks: List[TrackInfo]):
         self.tracks = tracks
     
-    def filter_tracks_by_type(self, track_type: str, remove_languages: List[str] = None,
-                            keep_languages: List[str] = None) -> List[int]:
-        """Return indices of tracks to remove based on language criteria for a specific track type."""
-        if not (remove_languages or keep_languages):
+    def filter_tracks(self, filters: Dict[str, LanguageFilter]) -> List[int]:
+        """Return indices of tracks to remove, given (remove, keep) languages per track type.
+
+        All track types are filtered in a single pass over the tracks.
+        """
+        if not filters:
             return []
-            
+
         tracks_to_remove = []
-        type_tracks = [t for t in self.tracks if t.type == track_type]
-        
-        for track in type_tracks:
+        for track in self.tracks:
+            languages = filters.get(track.type)
+            if languages is None:
+                continue
+            remove_languages, keep_languages = languages
             track_lang = track.language.lower() if track.language else 'und'
             
             if remove_languages and track_lang in remove_languages:
@@ -32,7 +39,7 @@ class TrackManager:
                 tracks_to_remove.append(track.index)
                 
         return tracks_to_remove
-    
+
     def get_track_summary(self) -> str:
         """Generate a human-readable summary of tracks."""
         summary = []
@@ -1,78 +1,193 @@
-import re
-import select
 import subprocess
 import logging
+import errno
+import hashlib
+import os
+import threading
 import multiprocessing
 from pathlib import Path
 import json
 import shutil
-import sys
-import time
+import tempfile
+from dataclasses import dataclass
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
 from typing import List, Dict, Any, Optional
 from tqdm import tqdm
-from .track_manager import TrackInfo, TrackManager
-from .space_analyzer import SpaceAnalyzer, format_size
+from .file_handler import VALID_EXTENSIONS
+from .track_manager import LanguageFilter, TrackInfo, TrackManager
+from .space_analyzer import SpaceAnalyzer, format_size, probe_video
 
 logger = logging.getLogger(__name__)
 
+# Errors that will hit every remaining file too, so the rest of the batch is abandoned.
+# ffmpeg reports them with the same strerror() text.
+_FATAL_ERRNOS = frozenset({errno.ENOSPC, errno.EDQUOT, errno.EROFS})
+_FATAL_MESSAGES = tuple(os.strerror(code) for code in _FATAL_ERRNOS)
+
+# Endings of the temp and staging files this tool writes, so cleanup never
+# touches anything else that happens to have .processing. in its name
+_PROCESSING_SUFFIXES = tuple(
+    f".processing{marker}{ext}" for marker in ('', '.swap') for ext in VALID_EXTENSIONS
+)
+
+_KERNEL_COPY_ERRNOS = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP)
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy size bytes between descriptors without a userspace buffer.
+
+    Returns False when neither copy_file_range() nor sendfile() can be used.
+    """
+    for name in ('copy_file_range', 'sendfile'):
+        if not hasattr(os, name):
+            continue
+        os.lseek(src_fd, 0, os.SEEK_SET)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        remaining = size
+        try:
+            while remaining > 0:
+                if name == 'copy_file_range':
+                    copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                else:
+                    copied = os.sendfile(dst_fd, src_fd, None, min(remaining, 64 << 20))
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_ERRNOS:
+                raise
+            continue
+        if remaining == 0:
+            return True
+    return False
+
+def _fast_copy(src: Path, dst: Path):
+    """Copy src to dst, including metadata, inside the kernel where possible.
+
+    copy_file_range() shares extents on reflink-capable filesystems (btrfs,
+    xfs) and otherwise copies in-kernel; sendfile() is the next best option
+    and shutil.copyfile() the last resort.
+    """
+    src_fd = os.open(src, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        try:
+            copied = _kernel_copy(src_fd, dst_fd, os.fstat(src_fd).st_size)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+def _fast_backup(src: Path, dst: Path):
+    """Keep a copy of src at dst as cheaply as the filesystem allows.
+
+    Tries a hard link first and falls back to an in-kernel copy.
+    """
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    _fast_copy(src, dst)
+
+def _fadvise(path: Path, advice_name: str):
+    """Give the kernel a page cache hint for a whole file, where supported."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.debug(f"posix_fadvise failed for {path}: {str(e)}")
+
+def _replace_file(src: Path, dst: Path):
+    """Atomically move src over dst, staging a copy next to dst across filesystems."""
+    try:
+        os.replace(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+    # Only a scratch dir on another filesystem gets here. Copy the data next to
+    # dst first and rename it into place, so dst is swapped atomically and is
+    # never seen half-written; a backup hard-linked to dst keeps the old inode.
+    logger.debug(f"{src} is on another filesystem, copying it back to {dst.parent}")
+    staging = dst.with_name(f"{dst.stem}.processing.swap{dst.suffix}")
+    try:
+        _fast_copy(src, staging)
+        os.replace(staging, dst)
+    except BaseException:
+        staging.unlink(missing_ok=True)
+        raise
+    src.unlink()
+
+@lru_cache(maxsize=1)
+def _ensure_ffmpeg():
+    """Verify ffmpeg and ffprobe once per process; failures are not cached."""
+    try:
+        subprocess.run(['ffmpeg', '-version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        subprocess.run(['ffprobe', '-version'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+    except subprocess.CalledProcessError:
+        raise RuntimeError("ffmpeg and/or ffprobe is not installed or not accessible")
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg and/or ffprobe is not installed")
+
+@dataclass
+class VideoAnalysis:
+    """Result of analyzing one video, carried through to the remux step."""
+    video_path: Path
+    tracks_to_remove: List[int]
+    duration: float = 0
+    savings: Optional[Dict[str, Any]] = None
+
 class VideoProcessor:
     def __init__(self, dry_run: bool = False, backup: bool = False, 
                  max_workers: int = None, batch_size: int = 3,
-                 file_limit: int = None):
+                 file_limit: int = None, ffmpeg_threads: int = None,
+                 scratch_dir: Optional[Path] = None, show_progress: bool = True):
         self.dry_run = dry_run
         self.backup = backup
-        self.max_workers = max_workers or max(1, multiprocessing.cpu_count() - 1)
+        # Analysis threads spend their time waiting on ffprobe, not on the CPU
+        self.max_workers = max_workers or 2 * multiprocessing.cpu_count()
         self.batch_size = batch_size
         self.file_limit = file_limit
+        # Split the CPUs between the concurrent ffmpegs instead of letting each
+        # one size its own thread pool to the whole machine
+        self.ffmpeg_threads = ffmpeg_threads or max(1, multiprocessing.cpu_count() // max(1, batch_size))
+        self.scratch_dir = Path(scratch_dir).resolve() if scratch_dir else None
+        # Without a terminal nobody sees per-file progress, so ffmpeg need not report it
+        self.show_progress = show_progress
+        if self.scratch_dir:
+            self.scratch_dir.mkdir(parents=True, exist_ok=True)
         self._check_ffmpeg()
 
     def _check_ffmpeg(self):
+        _ensure_ffmpeg()
+
+    def _get_video_duration(self, video_path: Path, _stat: os.stat_result = None) -> float:
+        """Read the duration from the cached probe rather than running ffprobe again."""
         try:
-            subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-            subprocess.run(['ffprobe', '-version'], capture_output=True, check=True)
-        except subprocess.CalledProcessError:
-            raise RuntimeError("ffmpeg and/or ffprobe is not installed or not accessible")
-        except FileNotFoundError:
-            raise RuntimeError("ffmpeg and/or ffprobe is not installed")
-
-    def _parse_progress(self, line: str) -> Optional[float]:
-        """Parse progress info from ffmpeg output."""
-        try:
-            if "time=" in line:
-                time_str = line.split("time=")[1].split()[0]
-                if ':' in time_str:
-                    h, m, s = map(float, time_str.replace(',', '.').split(':'))
-                    return h * 3600 + m * 60 + s
-                return float(time_str)
-            return None
-        except (ValueError, IndexError):
-            return None
-
-    def _get_video_duration(self, video_path: Path) -> float:
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-show_entries', 'format=duration',
-            '-of', 'default=noprint_wrappers=1:nokey=1',
-            str(video_path)
-        ]
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            return float(result.stdout.strip())
-        except (subprocess.CalledProcessError, ValueError):
+            return float(probe_video(video_path, _stat).get('format', {}).get('duration', 0))
+        except (OSError, subprocess.CalledProcessError, ValueError):
             return 0
 
-    def get_tracks(self, video_path: Path) -> List[TrackInfo]:
-        cmd = [
-            'ffprobe',
-            '-v', 'error',
-            '-print_format', 'json',
-            '-show_streams',
-            str(video_path)
-        ]
+    def get_tracks(self, video_path: Path, _stat: os.stat_result = None) -> List[TrackInfo]:
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
+            st = _stat or os.stat(video_path)
+            # Shares the cached probe with SpaceAnalyzer, so this and the
+            # later size estimate cost a single ffprobe run
+            data = probe_video(video_path, st)
             if not data.get('streams'):
                 raise RuntimeError("No streams found in the video file")
             
@@ -91,7 +206,7 @@ class VideoProcessor:
                 tracks.append(track)
             return tracks
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr.strip() if e.stderr else "Unknown error occurred"
+            error_msg = e.stderr.decode(errors='replace').strip() if e.stderr else "Unknown error occurred"
             raise RuntimeError(f"Failed to analyze video file: {error_msg}")
         except json.JSONDecodeError:
             raise RuntimeError("Failed to parse ffprobe output")
@@ -107,9 +222,7 @@ class VideoProcessor:
         manager = TrackManager(tracks)
         logger.info(manager.get_track_summary())
 
-    def preview_space_savings(self, video_path: Path, **kwargs):
-        analyzer = SpaceAnalyzer()
-        savings = analyzer.analyze_savings(video_path, **kwargs)
+    def _log_savings_preview(self, video_path: Path, savings: Dict[str, Any]):
         original_size = format_size(savings['original_size'])
         total_savings = format_size(savings['total_savings'])
         percentage = (savings['total_savings'] / savings['original_size'] * 100) if savings['original_size'] > 0 else 0
@@ -117,19 +230,164 @@ class VideoProcessor:
         logger.info(f"Track Analysis for: {video_path.name}")
         logger.info(f"Original Size: {original_size}")
         logger.info(f"Potential Savings: {total_savings} ({percentage:.1f}%)")
-        return savings
+
+    def _temp_path(self, video_path: Path) -> Path:
+        """Where ffmpeg writes the trimmed copy before it replaces the original.
+
+        By default this sits next to the video. With a scratch directory on
+        fast local storage the remux reads and writes different devices, at
+        the cost of a copy back when the result is moved into place. Scratch
+        names carry a hash of the source directory so that videos with the
+        same name in different folders do not collide.
+        """
+        if self.scratch_dir is None:
+            return video_path.with_name(f"{video_path.stem}.processing{video_path.suffix}")
+        tag = hashlib.sha1(str(video_path.parent).encode()).hexdigest()[:8]
+        return self.scratch_dir / f"{video_path.stem}.{tag}.processing{video_path.suffix}"
 
     def _build_ffmpeg_command(self, video_path: Path, mapping: List[str], temp_path: Path) -> List[str]:
         return [
             'ffmpeg',
+            '-nostats',
+            '-loglevel', 'error',
             '-i', str(video_path),
-            '-loglevel', 'info',
-            '-stats',
+            '-threads', str(self.ffmpeg_threads),
             *mapping,
             '-c', 'copy',
+            # Machine-readable key=value progress on stdout, leaving stderr for errors
+            *(('-progress', 'pipe:1') if self.show_progress else ()),
             str(temp_path)
         ]
 
+    def _watch_progress(self, process: subprocess.Popen, video_path: Path,
+                        duration: float, progress: Dict[Path, float]):
+        """Track ffmpeg's -progress output on stdout until it closes."""
+        # out_time_us -> percent
+        percent_per_us = 100.0 / (duration * 1_000_000)
+        # ffmpeg writes a dozen key=value lines per update; read them in
+        # chunks and only parse the latest out_time_us in each one
+        stdout_fd = process.stdout.fileno()
+        pending = b''
+        while chunk := os.read(stdout_fd, 65536):
+            pending += chunk
+            end = pending.rfind(b'\n')
+            if end < 0:
+                continue
+            lines, pending = pending[:end], pending[end + 1:]
+            if lines.endswith(b'progress=end'):
+                progress[video_path] = 100
+                continue
+            start = lines.rfind(b'out_time_us=')
+            if start < 0:
+                continue
+            line_end = lines.find(b'\n', start)
+            try:
+                out_time_us = int(lines[start + 12:line_end if line_end >= 0 else None])
+            except ValueError:  # N/A before the first packet
+                continue
+            progress[video_path] = min(100, out_time_us * percent_per_us)
+
+
+    @staticmethod
+    def _track_filters(kwargs: Dict[str, Any]) -> Dict[str, LanguageFilter]:
+        """Resolve the track_type -> (remove_languages, keep_languages) filters once per run.
+
+        Track types without any languages to remove or keep are left out.
+        """
+        filters = {}
+        if kwargs.get('process_audio'):
+            filters['audio'] = (
+                kwargs.get('remove_audio_languages'),
+                kwargs.get('keep_audio_languages')
+            )
+        if kwargs.get('process_subtitles'):
+            filters['subtitle'] = (
+                kwargs.get('remove_subtitle_languages'),
+                kwargs.get('keep_subtitle_languages')
+            )
+        return {track_type: langs for track_type, langs in filters.items() if langs[0] or langs[1]}
+
+    def _analyze_one(self, video_path: Path, filters: Dict[str, LanguageFilter]) -> VideoAnalysis:
+        """Work out which tracks to remove from one video and what that would save."""
+        # One stat per video, shared by every probe-cache lookup below
+        st = os.stat(video_path)
+        tracks = self.get_tracks(video_path, st)
+        # One pass over the tracks covers both audio and subtitle filters
+        tracks_to_remove = TrackManager(tracks).filter_tracks(filters)
+
+        analysis = VideoAnalysis(video_path, tracks_to_remove)
+        if tracks_to_remove:
+            analysis.duration = self._get_video_duration(video_path, st)
+            analysis.savings = SpaceAnalyzer().analyze_savings(video_path, filters, _stat=st)
+        return analysis
+
+    def _remux_video(self, analysis: VideoAnalysis, progress: Dict[Path, float], abort: threading.Event):
+        """Rewrite a video without the given tracks, replacing the original on success."""
+        if abort.is_set():
+            raise RuntimeError("Skipped because the run was stopped early")
+        video_path = analysis.video_path
+        tracks_to_remove = analysis.tracks_to_remove
+        duration = analysis.duration
+        if not duration:
+            raise ValueError(f"Could not determine duration for {video_path.name}")
+
+        # Per-file progress is only recorded here; the overall bar renders it
+        progress[video_path] = 0
+        try:
+            temp_path = self._temp_path(video_path)
+            mapping = ['-map', '0', *(arg for idx in tracks_to_remove for arg in ('-map', f'-0:{idx}'))]
+
+            cmd = self._build_ffmpeg_command(video_path, mapping, temp_path)
+            # Start read-ahead on the source before ffmpeg asks for it. The
+            # advice values are not flags, and SEQUENTIAL would only apply to
+            # our own descriptor, not ffmpeg's, so WILLNEED is the useful one.
+            _fadvise(video_path, 'POSIX_FADV_WILLNEED')
+
+            # stderr only carries errors now; spool it to a file so it can never
+            # fill a pipe and stall ffmpeg while we are reading progress
+            # Popen's context manager closes the pipe and reaps the process on
+            # every exit path; stdin is DEVNULL so ffmpeg never waits on a prompt
+            with tempfile.TemporaryFile() as stderr_file, subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE if self.show_progress else subprocess.DEVNULL,
+                stderr=stderr_file
+            ) as process:
+                try:
+                    if self.show_progress:
+                        self._watch_progress(process, video_path, duration, progress)
+                    process.wait()
+                except BaseException:
+                    process.kill()
+                    raise
+
+                if process.returncode != 0:
+                    if temp_path.exists():
+                        temp_path.unlink()
+                    stderr_file.seek(0)
+                    message = stderr_file.read().decode(errors='replace').strip()
+                    if any(fatal in message for fatal in _FATAL_MESSAGES):
+                        abort.set()
+                    raise RuntimeError(message)
+
+            try:
+                if self.backup:
+                    backup_path = video_path.with_suffix(video_path.suffix + '.bak')
+                    _fast_backup(video_path, backup_path)
+                _replace_file(temp_path, video_path)
+            except Exception as e:
+                if isinstance(e, OSError) and e.errno in _FATAL_ERRNOS:
+                    abort.set()
+                raise RuntimeError(f"Failed to move file: {str(e)}")
+            # The result will not be read again this run; let its pages go so
+            # they don't push the next file's data out of the cache
+            _fadvise(video_path, 'POSIX_FADV_DONTNEED')
+            if self.backup:
+                # The backup now owns the original's inode, and with it every page
+                # ffmpeg just read; nothing reads it again, so drop those too
+                _fadvise(backup_path, 'POSIX_FADV_DONTNEED')
+        finally:
+            progress.pop(video_path, None)
 
     def process_videos(self, videos: List[Path], **kwargs) -> Dict[str, Any]:
         total_videos = len(videos)
@@ -137,8 +395,8 @@ class VideoProcessor:
         successful_count = 0
         failed_count = 0
         errors = []
-        videos_to_process = []
         files_needing_changes = 0
+        skipped_count = 0
         total_savings = 0
         total_original_size = 0
 
@@ -146,12 +404,18 @@ class VideoProcessor:
         if self.file_limit:
             logger.info(f"Processing limit: {self.file_limit} files")
 
-        # Clean up any existing .processing files
-        for video in videos:
-            processing_path = video.with_name(f"{video.stem}.processing{video.suffix}")
-            if processing_path.exists():
+        # Clean up any existing .processing files, one directory listing per
+        # folder rather than a stat per video. The scratch dir holds the temp
+        # files, but a cross-device copy back stages next to the video itself.
+        temp_dirs = {video.parent for video in videos}
+        if self.scratch_dir:
+            temp_dirs.add(self.scratch_dir)
+        for temp_dir in temp_dirs:
+            for processing_path in temp_dir.glob('*.processing.*'):
+                if not processing_path.name.lower().endswith(_PROCESSING_SUFFIXES):
+                    continue
                 try:
-                    processing_path.unlink()
+                    processing_path.unlink(missing_ok=True)
                     logger.info(f"Cleaned up existing processing file: {processing_path.name}")
                 except Exception as e:
                     logger.error(f"Failed to clean up processing file {processing_path.name}: {str(e)}")
@@ -159,6 +423,7 @@ class VideoProcessor:
                         'total_videos': total_videos,
                         'files_scanned': 0,
                         'files_needing_changes': 0,
+                        'skipped': 0,
                         'successful': 0,
                         'failed': 1,
                         'total_savings': 0,
@@ -167,163 +432,115 @@ class VideoProcessor:
                     }
 
         logger.info("\nAnalyzing videos...")
-        for video_path in tqdm(videos, desc="Analyzing", unit="file"):
-            files_scanned += 1
-            if self.file_limit and len(videos_to_process) >= self.file_limit:
-                break
+        filters = self._track_filters(kwargs)
+        progress = {}
+        # Set by a remux that hits a full or read-only disk, or on interrupt; stops queued work
+        abort = threading.Event()
+        remux_futures = {}
+        # Analysis is mostly waiting on ffprobe, so threads are enough to overlap it.
+        # Each video goes to the remux pool as soon as its analysis finishes, so
+        # encoding starts with the first file rather than after the whole scan.
+        # The remux pool keeps batch_size ffmpegs running at all times.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as analyze_pool, \
+                ThreadPoolExecutor(max_workers=self.batch_size) as remux_pool, \
+                tqdm(total=0, desc="Overall Progress", unit="file", position=1) as overall_pbar:
+            # Draw per-file progress as the overall bar's postfix on a fixed cadence
+            # instead of redrawing one bar per file on every update
+            stop_refresh = threading.Event()
+
+            def refresh_progress():
+                while not stop_refresh.wait(0.5):
+                    overall_pbar.set_postfix_str(" | ".join(
+                        f"{path.name[:20]}: {percent:.0f}%" for path, percent in list(progress.items())
+                    ))
+
+            refresher = threading.Thread(target=refresh_progress, daemon=True)
+            if self.show_progress:
+                refresher.start()
 
             try:
-                tracks = self.get_tracks(video_path)
-                manager = TrackManager(tracks)
-                tracks_to_remove = []
-
-                if kwargs.get('process_audio'):
-                    audio_to_remove = manager.filter_tracks_by_type(
-                        'audio',
-                        kwargs.get('remove_audio_languages'),
-                        kwargs.get('keep_audio_languages')
-                    )
-                    tracks_to_remove.extend(audio_to_remove)
-
-                if kwargs.get('process_subtitles'):
-                    subs_to_remove = manager.filter_tracks_by_type(
-                        'subtitle',
-                        kwargs.get('remove_subtitle_languages'),
-                        kwargs.get('keep_subtitle_languages')
-                    )
-                    tracks_to_remove.extend(subs_to_remove)
-
-                if tracks_to_remove:
-                    videos_to_process.append((video_path, tracks_to_remove))
-                    files_needing_changes += 1
-                    savings = self.preview_space_savings(video_path, **kwargs)
-                    total_original_size += savings['original_size']
-                    total_savings += savings['total_savings']
-
-            except Exception as e:
-                logger.warning(f"Error analyzing {video_path.name}: {str(e)}")
-
-        if not videos_to_process:
-            return {
-                'total_videos': total_videos,
-                'files_scanned': files_scanned,
-                'files_needing_changes': 0,
-                'successful': 0,
-                'failed': 0,
-                'total_savings': 0,
-                'total_original_size': 0,
-                'errors': []
-            }
-
-        logger.info(f"\nFound {files_needing_changes} files that need processing")
-        if self.file_limit:
-            logger.info(f"Will process maximum {self.file_limit} files")
-        if total_savings > 0:
-            percentage = (total_savings / total_original_size) * 100
-            logger.info(f"Potential space savings: {format_size(total_savings)} ({percentage:.1f}%)")
-
-        logger.info("\nStarting processing...")
-        with tqdm(total=len(videos_to_process), desc="Overall Progress", unit="file") as overall_pbar:
-            for i in range(0, len(videos_to_process), self.batch_size):
-                batch = videos_to_process[i:i + self.batch_size]
-                active_processes = {}
-                progress_bars = {}
-
-                for video_path, tracks_to_remove in batch:
+                # Keep only a couple of analyses queued per thread and top the queue up
+                # from one shared iterator, so a large library never has a future per
+                # file and stopping at --limit has little queued work to throw away.
+                # Results are taken in scan order, not completion order, so --limit
+                # always picks the same files.
+                pending_videos = iter(videos)
+                futures = deque()
+
+                def submit_analyses(count: int):
+                    for video_path in islice(pending_videos, count):
+                        futures.append((analyze_pool.submit(self._analyze_one, video_path, filters), video_path))
+
+                submit_analyses(2 * self.max_workers)
+                with tqdm(total=total_videos, desc="Analyzing", unit="file", position=0) as analyze_pbar:
+                    while futures and not abort.is_set():
+                        future, video_path = futures.popleft()
+                        submit_analyses(1)
+                        files_scanned += 1
+                        try:
+                            analysis = future.result()
+                        except Exception as e:
+                            logger.warning(f"Error analyzing {video_path.name}: {str(e)}")
+                            continue
+                        finally:
+                            analyze_pbar.update(1)
+
+                        if analysis.tracks_to_remove:
+                            # Logged here rather than on the analysis threads, so previews
+                            # come out in scan order and only for files that are processed
+                            self._log_savings_preview(analysis.video_path, analysis.savings)
+                            files_needing_changes += 1
+                            total_original_size += analysis.savings['original_size']
+                            total_savings += analysis.savings['total_savings']
+                            remux_futures[remux_pool.submit(self._remux_video, analysis, progress, abort)] = analysis.video_path
+                            overall_pbar.total += 1
+                            overall_pbar.refresh()
+                        else:
+                            # Nothing to remove: never reaches ffmpeg or a remux slot
+                            skipped_count += 1
+
+                        if self.file_limit and files_needing_changes >= self.file_limit:
+                            break
+                for pending, _ in futures:
+                    pending.cancel()
+
+                if files_needing_changes:
+                    logger.info(f"\nFound {files_needing_changes} files that need processing")
+                    if total_savings > 0:
+                        percentage = (total_savings / total_original_size) * 100
+                        logger.info(f"Potential space savings: {format_size(total_savings)} ({percentage:.1f}%)")
+
+                for future in as_completed(remux_futures):
+                    video_path = remux_futures[future]
                     try:
-                        duration = self._get_video_duration(video_path)
-                        if not duration:
-                            raise ValueError(f"Could not determine duration for {video_path.name}")
-
-                        pbar = tqdm(
-                            total=100,
-                            desc=f"Processing {video_path.name[:50]}...",
-                            unit="%",
-                            position=len(progress_bars) + 1,
-                            leave=False
-                        )
-                        progress_bars[video_path] = pbar
-
-                        temp_path = video_path.with_name(f"{video_path.stem}.processing{video_path.suffix}")
-                        mapping = ['-map', '0']
-                        for idx in tracks_to_remove:
-                            mapping.extend(['-map', f'-0:{idx}'])
-
-                        cmd = [
-                            'ffmpeg',
-                            '-i', str(video_path),
-                            '-stats',
-                            '-loglevel', 'info',
-                            *mapping,
-                            '-c', 'copy',
-                            str(temp_path)
-                        ]
-                        
-                        process = subprocess.Popen(
-                            cmd,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE,
-                            universal_newlines=True,
-                            bufsize=1
-                        )
-                        active_processes[video_path] = (process, duration, temp_path)
-
+                        future.result()
+                        successful_count += 1
+                        logger.info(f"✓ Completed: {video_path.name}")
                     except Exception as e:
-                        logger.error(f"Failed to start {video_path.name}: {str(e)}")
-                        errors.append(f"{video_path.name}: {str(e)}")
                         failed_count += 1
-
-                while active_processes:
-                    for video_path, (process, duration, temp_path) in list(active_processes.items()):
-                        pbar = progress_bars[video_path]
-
-                        if process.poll() is not None:
-                            if process.returncode == 0:
-                                try:
-                                    if self.backup:
-                                        backup_path = video_path.with_suffix(video_path.suffix + '.bak')
-                                        shutil.copy2(video_path, backup_path)
-                                    shutil.move(str(temp_path), str(video_path))
-                                    successful_count += 1
-                                    pbar.n = 100
-                                    pbar.refresh()
-                                    logger.info(f"✓ Completed: {video_path.name}")
-                                except Exception as e:
-                                    failed_count += 1
-                                    errors.append(f"{video_path.name}: Failed to move file: {str(e)}")
-                                    logger.error(f"✗ Failed: {video_path.name}")
-                            else:
-                                failed_count += 1
-                                error_output = process.stderr.read()
-                                errors.append(f"{video_path.name}: {error_output}")
-                                logger.error(f"✗ Failed: {video_path.name}")
-                                if temp_path.exists():
-                                    temp_path.unlink()
-
-                            pbar.close()
-                            overall_pbar.update(1)
-                            del active_processes[video_path]
-                            continue
-
-                        stderr_ready = select.select([process.stderr], [], [], 0.1)[0]
-                        if stderr_ready:
-                            line = process.stderr.readline().strip()
-                            if line:
-                                time_match = re.search(r'time=(\d+:\d+:\d+\.\d+)', line)
-                                if time_match:
-                                    time_str = time_match.group(1)
-                                    h, m, s = map(float, time_str.split(':'))
-                                    progress = h * 3600 + m * 60 + s
-                                    percent = min(100, (progress / duration) * 100)
-                                    pbar.n = percent
-                                    pbar.refresh()
-
-                    time.sleep(0.1)
+                        errors.append(f"{video_path.name}: {str(e)}")
+                        logger.error(f"✗ Failed: {video_path.name}")
+                    overall_pbar.update(1)
+                if abort.is_set():
+                    logger.error("\nStopped early: the disk is full or read-only")
+            except BaseException:
+                # Ctrl-C (or a crash) here would otherwise leave the pools' __exit__
+                # waiting on every queued remux, starting new ffmpegs and replacing
+                # originals after the user asked to stop
+                abort.set()
+                analyze_pool.shutdown(wait=False, cancel_futures=True)
+                remux_pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            finally:
+                stop_refresh.set()
+                if self.show_progress:
+                    refresher.join()
 
         return {
             'total_videos': total_videos,
             'files_scanned': files_scanned,
             'files_needing_changes': files_needing_changes,
+            'skipped': skipped_count,
             'successful': successful_count,
             'failed': failed_count,
             'total_savings': total_savings,